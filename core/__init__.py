@@ -1,3 +1,6 @@
 from .base_filter import BaseFilter
+from .cache import cached_fetch, invalidate
+from .dataloader import UserLoader, CollectionLoader, RevisionLoader
 from .dependencies import DBSession
 from .renderer import CustomResponse, get_response_schema
+from .security import hash_password, verify_password
@@ -0,0 +1,77 @@
+import hashlib
+import logging
+from typing import Any, Dict, List, Sequence
+
+import orjson
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+
+from setting import setting
+
+__all__ = ["cache", "cached_fetch", "invalidate"]
+
+logger = logging.getLogger(__name__)
+
+# Shared async Redis client; connections are opened lazily on first use
+cache = aioredis.from_url(setting.REDIS_URI)
+
+
+def make_key(stmt: Select) -> str:
+    """Hash the compiled SQL plus bind params into a stable cache key."""
+    compiled = stmt.compile(compile_kwargs={"literal_binds": False})
+    raw = f"{compiled}|{sorted(compiled.params.items())}"
+    return "q:" + hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+
+async def cached_fetch(
+        session: AsyncSession,
+        stmt: Select,
+        schema,
+        ttl: int = 60,
+        tags: Sequence[str] = (),
+) -> List[Dict[str, Any]]:
+    """Serve a read query from Redis, falling back to the database.
+
+    Serialized rows are stored under a hash of the SQL + bind params for
+    `ttl` seconds and tagged per table name so write paths can call
+    `invalidate` with the tables they touched. The cache fails open:
+    any Redis error is logged and the query runs against the database,
+    so an unavailable cache never breaks a read endpoint.
+    """
+    key = make_key(stmt)
+    try:
+        hit = await cache.get(key)
+    except (RedisError, OSError):
+        logger.warning("cache get failed for %s; querying db", key)
+        hit = None
+    if hit is not None:
+        return orjson.loads(hit)
+
+    rows = (await session.execute(stmt)).scalars().all()
+    content = schema.dump(rows, many=True)
+    try:
+        await cache.setex(key, ttl, orjson.dumps(content, default=str))
+        for tag in tags:
+            await cache.sadd(f"tag:{tag}", key)
+    except (RedisError, OSError):
+        logger.warning("cache store failed for %s", key)
+    return content
+
+
+async def invalidate(*tables: str) -> None:
+    """Drop every cached query tagged with one of the given tables.
+
+    Best-effort: if Redis is down the entries expire via their TTL
+    instead of failing the write path.
+    """
+    for table in tables:
+        tag = f"tag:{table}"
+        try:
+            keys = await cache.smembers(tag)
+            if keys:
+                await cache.delete(*keys)
+            await cache.delete(tag)
+        except (RedisError, OSError):
+            logger.warning("cache invalidation failed for %s", tag)
@@ -0,0 +1,97 @@
+"""Per-request batch loaders.
+
+UserLoader backs author rendering on the content list endpoints;
+CollectionLoader and RevisionLoader wait on the record/revision
+endpoints that are still stubs.
+"""
+from typing import Annotated, List, Optional
+from uuid import UUID
+
+from aiodataloader import DataLoader
+from fastapi import Depends
+from sqlalchemy import select
+
+from core.dependencies import DBSession
+from models.orm_models.core import Collection, Revision, User
+
+__all__ = ["UserLoader", "CollectionLoader", "RevisionLoader",
+           "Users", "Collections", "Revisions"]
+
+
+class UserLoader(DataLoader):
+    """Batch users by id.
+
+    Awaits issued within one event-loop tick coalesce into a single
+    WHERE id IN (...) query, so rendering N items with authors costs one
+    SELECT instead of N. Loaders are per-request dependencies; never
+    share one across requests or its cache outlives the session.
+    """
+
+    def __init__(self, session):
+        super().__init__()
+        self.session = session
+
+    async def batch_load_fn(self, keys: List[UUID]) -> List[Optional[User]]:
+        rows = (
+            await self.session.execute(select(User).where(User.id.in_(keys)))
+        ).scalars().all()
+        by_id = {row.id: row for row in rows}
+        return [by_id.get(key) for key in keys]
+
+
+class CollectionLoader(DataLoader):
+    """Batch collections by their unique name."""
+
+    def __init__(self, session):
+        super().__init__()
+        self.session = session
+
+    async def batch_load_fn(
+            self, keys: List[str],
+    ) -> List[Optional[Collection]]:
+        rows = (
+            await self.session.execute(
+                select(Collection).where(Collection.collection.in_(keys)))
+        ).scalars().all()
+        by_name = {row.collection: row for row in rows}
+        return [by_name.get(key) for key in keys]
+
+
+class RevisionLoader(DataLoader):
+    """Batch the latest revision per content item id."""
+
+    def __init__(self, session):
+        super().__init__()
+        self.session = session
+
+    async def batch_load_fn(
+            self, keys: List[UUID],
+    ) -> List[Optional[Revision]]:
+        # DISTINCT ON keeps one row per item in the database instead of
+        # dragging every historical revision over the wire
+        rows = (
+            await self.session.execute(
+                select(Revision)
+                .distinct(Revision.item_id)
+                .where(Revision.item_id.in_(keys))
+                .order_by(Revision.item_id, Revision.created_at.desc()))
+        ).scalars().all()
+        latest = {row.item_id: row for row in rows}
+        return [latest.get(key) for key in keys]
+
+
+def user_loader(session: DBSession) -> UserLoader:
+    return UserLoader(session)
+
+
+def collection_loader(session: DBSession) -> CollectionLoader:
+    return CollectionLoader(session)
+
+
+def revision_loader(session: DBSession) -> RevisionLoader:
+    return RevisionLoader(session)
+
+
+Users = Annotated[UserLoader, Depends(user_loader)]
+Collections = Annotated[CollectionLoader, Depends(collection_loader)]
+Revisions = Annotated[RevisionLoader, Depends(revision_loader)]
@@ -1,7 +1,7 @@
 import copy
 from typing import Any, Dict, List, Optional
 
-import ujson
+import orjson
 from fastapi import status
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel
@@ -50,13 +50,10 @@ class CustomResponse(JSONResponse):
 
     def render(self, content: Any) -> bytes:
         content = self.clean()
-        return ujson.dumps(
-            content,
-            ensure_ascii=False,
-            allow_nan=False,
-            default=str,
-            separators=(",", ":"),
-        ).encode("utf-8")
+        # orjson emits compact UTF-8 bytes and handles UUID/datetime
+        # natively; default=str covers anything else marshmallow lets
+        # through
+        return orjson.dumps(content, default=str)
 
 
 # Define the Info model
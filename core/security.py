@@ -0,0 +1,45 @@
+import asyncio
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from passlib.context import CryptContext
+
+from setting import setting
+
+__all__ = ["hash_password", "verify_password", "hash_token", "hash_pool"]
+
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+# Dedicated pool for CPU-bound hashing: one bcrypt call costs tens to
+# hundreds of milliseconds and would stall every other in-flight
+# coroutine if run on the loop thread
+hash_pool = ThreadPoolExecutor(
+    max_workers=min(8, (os.cpu_count() or 1) * 2),
+    thread_name_prefix="pwdhash",
+)
+
+
+async def hash_password(password: str) -> str:
+    """Hash a password off the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(hash_pool, pwd_context.hash, password)
+
+
+async def verify_password(password: str, hashed: str) -> bool:
+    """Check a password against its hash off the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        hash_pool, pwd_context.verify, password, hashed,
+    )
+
+
+def hash_token(token: str) -> bytes:
+    """Keyed blake2b-256 digest used to store and look up refresh tokens.
+
+    Fast enough to run on the loop thread; keying with the app secret
+    means a leaked table cannot be brute-forced offline.
+    """
+    return hashlib.blake2b(
+        token.encode(), digest_size=32, key=setting.SECRET_KEY.encode(),
+    ).digest()
@@ -0,0 +1,18 @@
+"""Gunicorn configuration for production deployments.
+
+Run with:
+    gunicorn main:app -c gunicorn.conf.py
+"""
+import multiprocessing
+
+bind = "0.0.0.0:8000"
+# 2*N+1 workers saturates N cores while leaving headroom for blocking I/O
+workers = multiprocessing.cpu_count() * 2 + 1
+# UvicornWorker picks uvloop/httptools automatically when installed
+worker_class = "uvicorn.workers.UvicornWorker"
+# Trust proxy headers when behind nginx/haproxy
+forwarded_allow_ips = "*"
+# Access logging is a measurable per-request cost; keep it off in prod
+accesslog = None
+errorlog = "-"
+loglevel = "warning"
@@ -0,0 +1,35 @@
+"""dedupe device event index
+
+Revision ID: a6f40b92c8d5
+Revises: f8c25d1a7b43
+Create Date: 2025-05-22 08:19:44.273561
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a6f40b92c8d5'
+down_revision: Union[str, None] = 'f8c25d1a7b43'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Align with the model, which only declares the ix_* index via
+    # index=True on the device_fk column
+    op.drop_index('idx_mitre_device_events_device_id', table_name='mitre_device_events')
+    op.create_index(
+        op.f('ix_mitre_device_events_device_id'),
+        'mitre_device_events', ['device_id'], unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_mitre_device_events_device_id'), table_name='mitre_device_events')
+    op.create_index('idx_mitre_device_events_device_id', 'mitre_device_events', ['device_id'], unique=False)
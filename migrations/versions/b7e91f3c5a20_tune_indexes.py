@@ -0,0 +1,49 @@
+"""tune indexes
+
+Revision ID: b7e91f3c5a20
+Revises: 4ac3f4f682e2
+Create Date: 2025-05-21 09:42:11.381204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e91f3c5a20'
+down_revision: Union[str, None] = '4ac3f4f682e2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # duplicates of the ix_* indexes created via index=True
+    op.drop_index('idx_mitre_users_email', table_name='mitre_users')
+    op.drop_index('idx_mitre_users_username', table_name='mitre_users')
+    # prefix of idx_content_collection_status_lastmod
+    op.drop_index('idx_mitre_content_collection_status', table_name='mitre_content')
+    # duplicate of ix_mitre_content_created_by
+    op.drop_index('idx_mitre_content_created_by', table_name='mitre_content')
+    op.create_index(
+        'idx_content_published', 'mitre_content',
+        ['collection', 'published_at'], unique=False,
+        postgresql_where=sa.text("status = 'published' AND is_draft = false"),
+    )
+    op.create_index(
+        'idx_refresh_active', 'mitre_refresh_tokens',
+        ['user_id'], unique=False,
+        postgresql_where=sa.text('is_revoked = false'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_refresh_active', table_name='mitre_refresh_tokens')
+    op.drop_index('idx_content_published', table_name='mitre_content')
+    op.create_index('idx_mitre_content_created_by', 'mitre_content', ['created_by'], unique=False)
+    op.create_index('idx_mitre_content_collection_status', 'mitre_content', ['collection', 'status'], unique=False)
+    op.create_index('idx_mitre_users_username', 'mitre_users', ['username'], unique=False)
+    op.create_index('idx_mitre_users_email', 'mitre_users', ['email'], unique=False)
@@ -0,0 +1,66 @@
+"""json to jsonb
+
+Revision ID: c3d02a8e41f7
+Revises: b7e91f3c5a20
+Create Date: 2025-05-21 10:05:47.912633
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3d02a8e41f7'
+down_revision: Union[str, None] = 'b7e91f3c5a20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column) pairs stored as json that move to jsonb
+JSON_COLUMNS = [
+    ('mitre_device_types', 'schema'),
+    ('mitre_devices', 'credentials'),
+    ('mitre_devices', 'properties'),
+    ('mitre_device_events', 'payload'),
+    ('mitre_collections', 'icon'),
+    ('mitre_collections', 'note'),
+    ('mitre_collections', 'translations'),
+    ('mitre_fields', 'schema'),
+    ('mitre_fields', 'interface'),
+    ('mitre_fields', 'options'),
+    ('mitre_revisions', 'data'),
+    ('mitre_content', 'data'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, column in JSON_COLUMNS:
+        op.alter_column(
+            table, column,
+            type_=JSONB,
+            postgresql_using=f'{column}::jsonb',
+        )
+    op.create_index(
+        'idx_content_data_gin', 'mitre_content', ['data'],
+        unique=False, postgresql_using='gin',
+    )
+    op.create_index(
+        'idx_device_events_payload_gin', 'mitre_device_events', ['payload'],
+        unique=False, postgresql_using='gin',
+        postgresql_ops={'payload': 'jsonb_path_ops'},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_device_events_payload_gin', table_name='mitre_device_events')
+    op.drop_index('idx_content_data_gin', table_name='mitre_content')
+    for table, column in reversed(JSON_COLUMNS):
+        op.alter_column(
+            table, column,
+            type_=sa.JSON(),
+            postgresql_using=f'{column}::json',
+        )
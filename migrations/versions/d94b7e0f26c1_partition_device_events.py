@@ -0,0 +1,133 @@
+"""partition device events
+
+Revision ID: d94b7e0f26c1
+Revises: c3d02a8e41f7
+Create Date: 2025-05-21 10:38:02.547119
+
+"""
+from datetime import date
+from typing import List, Sequence, Tuple, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd94b7e0f26c1'
+down_revision: Union[str, None] = 'c3d02a8e41f7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def initial_partitions(months: int = 4) -> List[Tuple[str, str, str]]:
+    """Monthly partition bounds starting at the month this migration runs.
+
+    Bounds are computed at run time so the pre-created partitions cover
+    incoming inserts regardless of when the migration lands; keep a
+    cron/pg_partman job creating the next month ahead of time.
+    """
+    year, month = date.today().year, date.today().month
+    bounds = []
+    for _ in range(months):
+        next_year, next_month = \
+            (year + 1, 1) if month == 12 else (year, month + 1)
+        bounds.append((
+            f'mitre_device_events_{year:04d}_{month:02d}',
+            f'{year:04d}-{month:02d}-01',
+            f'{next_year:04d}-{next_month:02d}-01',
+        ))
+        year, month = next_year, next_month
+    return bounds
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Plain -> partitioned requires a rebuild. Rename the old table
+    # aside, recreate it as the partitioned parent, copy the rows back
+    # and only then drop the original, so no events are lost.
+    op.drop_index('idx_device_events_payload_gin', table_name='mitre_device_events')
+    op.drop_index('idx_mitre_device_events_timestamp', table_name='mitre_device_events')
+    op.drop_index('idx_mitre_device_events_device_id', table_name='mitre_device_events')
+    op.execute('ALTER TABLE mitre_device_events RENAME TO mitre_device_events_old')
+    # The primary key index keeps its old name across the rename and
+    # would collide with the new parent's
+    op.execute(
+        'ALTER TABLE mitre_device_events_old '
+        'RENAME CONSTRAINT mitre_device_events_pkey TO mitre_device_events_old_pkey'
+    )
+    op.create_table('mitre_device_events',
+    sa.Column('device_id', sa.UUID(), nullable=False, comment='FK to the device generating the event'),
+    sa.Column('event_type', sa.String(), nullable=False, comment='Type of event (telemetry, alert, status)'),
+    sa.Column('payload', JSONB(), nullable=False, comment='Event data payload'),
+    sa.Column('timestamp', sa.DateTime(), nullable=False, comment='Event generation timestamp'),
+    sa.Column('processed', sa.Boolean(), nullable=False, comment='Whether the event has been processed by workflows'),
+    sa.Column('id', sa.UUID(), nullable=False, comment='Universal primary key UUID'),
+    sa.ForeignKeyConstraint(['device_id'], ['mitre_devices.id'], ),
+    sa.PrimaryKeyConstraint('id', 'timestamp'),
+    postgresql_partition_by='RANGE (timestamp)'
+    )
+    # Parent-level indexes propagate to every child partition
+    op.create_index('idx_mitre_device_events_device_id', 'mitre_device_events', ['device_id'], unique=False)
+    op.create_index('idx_mitre_device_events_timestamp', 'mitre_device_events', ['timestamp'], unique=False)
+    op.create_index(
+        'idx_device_events_payload_gin', 'mitre_device_events', ['payload'],
+        unique=False, postgresql_using='gin',
+        postgresql_ops={'payload': 'jsonb_path_ops'},
+    )
+    for name, start, end in initial_partitions():
+        op.execute(
+            f"CREATE TABLE {name} PARTITION OF mitre_device_events "
+            f"FOR VALUES FROM ('{start}') TO ('{end}')"
+        )
+    op.execute(
+        "CREATE TABLE mitre_device_events_default "
+        "PARTITION OF mitre_device_events DEFAULT"
+    )
+    # Rows older than the first pre-created month route to the default
+    # partition, which stays a catch-all for stray timestamps only
+    op.execute(
+        'INSERT INTO mitre_device_events '
+        '(device_id, event_type, payload, timestamp, processed, id) '
+        'SELECT device_id, event_type, payload, timestamp, processed, id '
+        'FROM mitre_device_events_old'
+    )
+    op.execute('DROP TABLE mitre_device_events_old')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Mirror the upgrade: rename the partitioned parent aside, rebuild
+    # the plain table, copy the rows back, then drop parent + partitions
+    op.drop_index('idx_device_events_payload_gin', table_name='mitre_device_events')
+    op.drop_index('idx_mitre_device_events_timestamp', table_name='mitre_device_events')
+    op.drop_index('idx_mitre_device_events_device_id', table_name='mitre_device_events')
+    op.execute('ALTER TABLE mitre_device_events RENAME TO mitre_device_events_old')
+    op.execute(
+        'ALTER TABLE mitre_device_events_old '
+        'RENAME CONSTRAINT mitre_device_events_pkey TO mitre_device_events_old_pkey'
+    )
+    op.create_table('mitre_device_events',
+    sa.Column('device_id', sa.UUID(), nullable=False, comment='FK to the device generating the event'),
+    sa.Column('event_type', sa.String(), nullable=False, comment='Type of event (telemetry, alert, status)'),
+    sa.Column('payload', JSONB(), nullable=False, comment='Event data payload'),
+    sa.Column('timestamp', sa.DateTime(), nullable=False, comment='Event generation timestamp'),
+    sa.Column('processed', sa.Boolean(), nullable=False, comment='Whether the event has been processed by workflows'),
+    sa.Column('id', sa.UUID(), nullable=False, comment='Universal primary key UUID'),
+    sa.ForeignKeyConstraint(['device_id'], ['mitre_devices.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('idx_mitre_device_events_device_id', 'mitre_device_events', ['device_id'], unique=False)
+    op.create_index('idx_mitre_device_events_timestamp', 'mitre_device_events', ['timestamp'], unique=False)
+    op.create_index(
+        'idx_device_events_payload_gin', 'mitre_device_events', ['payload'],
+        unique=False, postgresql_using='gin',
+        postgresql_ops={'payload': 'jsonb_path_ops'},
+    )
+    op.execute(
+        'INSERT INTO mitre_device_events '
+        '(device_id, event_type, payload, timestamp, processed, id) '
+        'SELECT device_id, event_type, payload, timestamp, processed, id '
+        'FROM mitre_device_events_old'
+    )
+    op.execute('DROP TABLE mitre_device_events_old')  # drops child partitions too
@@ -0,0 +1,42 @@
+"""server side timestamps
+
+Revision ID: e5a18c4b9d32
+Revises: d94b7e0f26c1
+Create Date: 2025-05-21 11:02:36.118457
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a18c4b9d32'
+down_revision: Union[str, None] = 'd94b7e0f26c1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column) pairs whose defaults move from Python to the server
+TIMESTAMP_COLUMNS = [
+    ('mitre_users', 'created_at'),
+    ('mitre_oauth_identities', 'created_at'),
+    ('mitre_refresh_tokens', 'created_at'),
+    ('mitre_device_events', 'timestamp'),
+    ('mitre_sync_logs', 'last_synced_at'),
+    ('mitre_revisions', 'created_at'),
+    ('mitre_content', 'created_at'),
+    ('mitre_content', 'last_modified'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, column in TIMESTAMP_COLUMNS:
+        op.alter_column(table, column, server_default=sa.func.now())
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, column in TIMESTAMP_COLUMNS:
+        op.alter_column(table, column, server_default=None)
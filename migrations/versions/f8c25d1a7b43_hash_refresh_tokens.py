@@ -0,0 +1,52 @@
+"""hash refresh tokens
+
+Revision ID: f8c25d1a7b43
+Revises: e5a18c4b9d32
+Create Date: 2025-05-21 11:47:53.026815
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f8c25d1a7b43'
+down_revision: Union[str, None] = 'e5a18c4b9d32'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Raw tokens cannot be re-hashed with the keyed digest, so existing
+    # sessions are invalidated and clients re-authenticate
+    op.execute('DELETE FROM mitre_refresh_tokens')
+    op.drop_index('idx_mitre_refresh_tokens_token', table_name='mitre_refresh_tokens')
+    op.drop_index(op.f('ix_mitre_refresh_tokens_token'), table_name='mitre_refresh_tokens')
+    op.drop_column('mitre_refresh_tokens', 'token')
+    op.add_column(
+        'mitre_refresh_tokens',
+        sa.Column(
+            'token_hash', sa.LargeBinary(length=32), nullable=False,
+            comment='Keyed blake2b-256 digest of the refresh token',
+        ),
+    )
+    op.create_index(
+        op.f('ix_mitre_refresh_tokens_token_hash'),
+        'mitre_refresh_tokens', ['token_hash'], unique=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute('DELETE FROM mitre_refresh_tokens')
+    op.drop_index(op.f('ix_mitre_refresh_tokens_token_hash'), table_name='mitre_refresh_tokens')
+    op.drop_column('mitre_refresh_tokens', 'token_hash')
+    op.add_column(
+        'mitre_refresh_tokens',
+        sa.Column('token', sa.Text(), nullable=False, comment='Refresh token string'),
+    )
+    op.create_index(op.f('ix_mitre_refresh_tokens_token'), 'mitre_refresh_tokens', ['token'], unique=True)
+    op.create_index('idx_mitre_refresh_tokens_token', 'mitre_refresh_tokens', ['token'], unique=False)
@@ -2,23 +2,63 @@
 
 import datetime
 import uuid
-from typing import Optional, Dict, Any
+from typing import Annotated, Optional, Dict, Any
 
 from sqlalchemy import (
-    JSON,
     UUID,
     Boolean,
     DateTime,
     ForeignKey,
     Index,
     Integer,
+    LargeBinary,
+    PrimaryKeyConstraint,
     String,
     Text,
+    text,
+)
+from uuid6 import uuid7
+
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.schema import CreateTable
+from sqlalchemy.sql import func
+from sqlalchemy.orm import (
+    DeclarativeBase,
+    Mapped,
+    mapped_column,
+    relationship,
 )
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 from models.orm_models.crud import CRUD
 
+# Shared column factories: SQLAlchemy resolves each Annotated alias once,
+# so models reuse one definition instead of rebuilding identical
+# mapped_column(...) declarations per class
+created_ts = Annotated[
+    datetime.datetime,
+    mapped_column(
+        DateTime, nullable=False, server_default=func.now(),
+        comment="Row creation timestamp",
+    ),
+]
+user_fk = Annotated[
+    uuid.UUID,
+    mapped_column(
+        UUID(as_uuid=True), ForeignKey("mitre_users.id"),
+        nullable=False, index=True,
+        comment="FK to the associated user",
+    ),
+]
+device_fk = Annotated[
+    uuid.UUID,
+    mapped_column(
+        UUID(as_uuid=True), ForeignKey("mitre_devices.id"),
+        nullable=False, index=True,
+        comment="FK to the associated device",
+    ),
+]
+
 __all__ = [
     "User",
     "RefreshToken",
@@ -36,6 +76,7 @@ __all__ = [
     "Taxonomy",
     "Translation",
     "Content",
+    "DDL_STATEMENTS",
 ]
 
 class Base(DeclarativeBase, CRUD):
@@ -47,7 +88,9 @@ class Base(DeclarativeBase, CRUD):
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        # Time-ordered UUIDv7: inserts append to the right edge of the
+        # PK B-tree instead of landing at random pages
+        default=uuid7,
         comment="Universal primary key UUID",
     )
 
@@ -74,26 +117,17 @@ class User(Base):
         Boolean, nullable=False, default=False,
         comment="Whether the user has admin privileges",
     )
-    created_at: Mapped[datetime.datetime] = mapped_column(
-        DateTime, nullable=False, default=datetime.datetime.now,
-        comment="Account creation timestamp",
-    )
+    created_at: Mapped[created_ts]
     last_login: Mapped[Optional[datetime.datetime]] = mapped_column(
         DateTime, nullable=True,
         comment="Timestamp of last successful login",
     )
-    __table_args__ = (
-        Index("idx_mitre_users_email", "email"),
-        Index("idx_mitre_users_username", "username"),
-    )
+    # email/username are already indexed via index=True on the columns
 
 # OAuth Identity table for external providers
 class OAuthIdentity(Base):
     __tablename__ = "mitre_oauth_identities"
-    user_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("mitre_users.id"), nullable=False, index=True,
-        comment="FK to the associated user",
-    )
+    user_id: Mapped[user_fk]
     provider: Mapped[str] = mapped_column(
         String(50), nullable=False,
         comment="OAuth provider (e.g., google, github)",
@@ -111,10 +145,10 @@ class OAuthIdentity(Base):
     token_expiry: Mapped[Optional[datetime.datetime]] = mapped_column(
         DateTime, nullable=True, comment="Expiry timestamp for access token",
     )
-    created_at: Mapped[datetime.datetime] = mapped_column(
-        DateTime, nullable=False, default=datetime.datetime.now,
-        comment="Identity creation timestamp",
-    )
+    created_at: Mapped[created_ts]
+    # lazy="raise" turns accidental lazy loads into errors; load
+    # explicitly with selectinload() where the relationship is needed
+    user: Mapped["User"] = relationship("User", lazy="raise")
     __table_args__ = (
         Index(
             "idx_mitre_oauth_identities_provider_user_id",
@@ -125,27 +159,25 @@ class OAuthIdentity(Base):
 # Refresh Token table for JWT authentication
 class RefreshToken(Base):
     __tablename__ = "mitre_refresh_tokens"
-    user_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("mitre_users.id"), nullable=False, index=True,
-        comment="FK to the associated user",
-    )
-    token: Mapped[str] = mapped_column(
-        Text, nullable=False, unique=True, index=True,
-        comment="Refresh token string",
+    user_id: Mapped[user_fk]
+    token_hash: Mapped[bytes] = mapped_column(
+        LargeBinary(32), nullable=False, unique=True, index=True,
+        comment="Keyed blake2b-256 digest of the refresh token",
     )
     expires_at: Mapped[datetime.datetime] = mapped_column(
         DateTime, nullable=False, comment="Token expiry timestamp",
     )
-    created_at: Mapped[datetime.datetime] = mapped_column(
-        DateTime, nullable=False, default=datetime.datetime.now,
-        comment="Token creation timestamp",
-    )
+    created_at: Mapped[created_ts]
     is_revoked: Mapped[bool] = mapped_column(
         Boolean, nullable=False, default=False,
         comment="Whether the token is revoked",
     )
     __table_args__ = (
-        Index("idx_mitre_refresh_tokens_token", "token"),
+        # Partial index: token lookups only ever want live tokens
+        Index(
+            "idx_refresh_active", "user_id",
+            postgresql_where=text("is_revoked = false"),
+        ),
     )
 
 # Device Management Tables
@@ -166,8 +198,8 @@ class DeviceType(Base):
     description: Mapped[Optional[str]] = mapped_column(
         String, nullable=True, comment="Description of device type capabilities",
     )
-    schema: Mapped[Optional[JSON]] = mapped_column(
-        JSON, nullable=True, comment="Optional telemetry data schema",
+    schema: Mapped[Optional[JSONB]] = mapped_column(
+        JSONB, nullable=True, comment="Optional telemetry data schema",
     )
 
 class Device(Base):
@@ -195,50 +227,56 @@ class Device(Base):
         comment="Whether provisioning is complete",
     )
     credentials: Mapped[Optional[Dict[str, Any]]] = mapped_column(
-        JSON, nullable=True, comment="Provisioning credentials or cert thumbprints",
+        JSONB, nullable=True, comment="Provisioning credentials or cert thumbprints",
     )
     properties: Mapped[Optional[Dict[str, Any]]] = mapped_column(
-        JSON, nullable=True, comment="Additional device-specific properties",
+        JSONB, nullable=True, comment="Additional device-specific properties",
     )
 
 class DeviceEvent(Base):
     __tablename__ = "mitre_device_events"
-    device_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("mitre_devices.id"), nullable=False, index=True,
-        comment="FK to the device generating the event",
-    )
+    device_id: Mapped[device_fk]
     event_type: Mapped[str] = mapped_column(
         String, nullable=False, comment="Type of event (telemetry, alert, status)",
     )
     payload: Mapped[Dict[str, Any]] = mapped_column(
-        JSON, nullable=False, comment="Event data payload",
+        JSONB, nullable=False, comment="Event data payload",
     )
     timestamp: Mapped[datetime.datetime] = mapped_column(
-        DateTime, nullable=False, default=datetime.datetime.now,
+        DateTime, nullable=False, server_default=func.now(),
+        # Partition key; must be part of the primary key on the parent
+        primary_key=True,
         comment="Event generation timestamp",
     )
     processed: Mapped[bool] = mapped_column(
         Boolean, nullable=False, default=False,
         comment="Whether the event has been processed by workflows",
     )
+    # Range-partitioned by month: recent-window queries prune to one
+    # partition whose indexes fit in RAM; old months detach in O(1).
+    # Indexes are declared on the parent so they propagate to children.
     __table_args__ = (
-        Index("idx_mitre_device_events_device_id", "device_id"),
+        # Explicit PK keeps id leading (for id lookups) while including
+        # the partition key, as Postgres requires on the parent
+        PrimaryKeyConstraint("id", "timestamp"),
+        # device_id is already indexed via index=True on device_fk
         Index("idx_mitre_device_events_timestamp", "timestamp"),
+        # jsonb_path_ops GIN: smaller index, supports @> containment
+        Index(
+            "idx_device_events_payload_gin", "payload",
+            postgresql_using="gin",
+            postgresql_ops={"payload": "jsonb_path_ops"},
+        ),
+        {"postgresql_partition_by": "RANGE (timestamp)"},
     )
 
 class SyncLog(Base):
     __tablename__ = "mitre_sync_logs"
-    device_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("mitre_devices.id"), nullable=False, index=True,
-        comment="FK to the device performing sync",
-    )
+    device_id: Mapped[device_fk]
     collection: Mapped[str] = mapped_column(
         String, nullable=False, comment="Collection being synced",
     )
-    last_synced_at: Mapped[datetime.datetime] = mapped_column(
-        DateTime, nullable=False, default=datetime.datetime.now,
-        comment="Last successful sync timestamp",
-    )
+    last_synced_at: Mapped[created_ts]
     conflict_count: Mapped[int] = mapped_column(
         Integer, nullable=False, default=0,
         comment="Number of conflicts detected",
@@ -253,9 +291,9 @@ class Collection(Base):
     collection: Mapped[str] = mapped_column(String, unique=True, nullable=False)
     hidden: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
     singleton: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
-    icon: Mapped[JSON] = mapped_column(JSON, nullable=True)
-    note: Mapped[JSON] = mapped_column(JSON, nullable=True)
-    translations: Mapped[JSON] = mapped_column(JSON, nullable=True)
+    icon: Mapped[JSONB] = mapped_column(JSONB, nullable=True)
+    note: Mapped[JSONB] = mapped_column(JSONB, nullable=True)
+    translations: Mapped[JSONB] = mapped_column(JSONB, nullable=True)
     __table_args__ = (Index("idx_mitre_collections_hidden", "hidden"),)
 
 class Field(Base):
@@ -263,9 +301,9 @@ class Field(Base):
     collection: Mapped[str] = mapped_column(ForeignKey("mitre_collections.collection"), nullable=False, index=True)
     field: Mapped[str] = mapped_column(String, nullable=False, index=True, unique=True)
     type: Mapped[str] = mapped_column(String, nullable=False, index=True)
-    schema: Mapped[JSON] = mapped_column(JSON, nullable=True)
-    interface: Mapped[JSON] = mapped_column(JSON, nullable=True)
-    options: Mapped[JSON] = mapped_column(JSON, nullable=True)
+    schema: Mapped[JSONB] = mapped_column(JSONB, nullable=True)
+    interface: Mapped[JSONB] = mapped_column(JSONB, nullable=True)
+    options: Mapped[JSONB] = mapped_column(JSONB, nullable=True)
     __table_args__ = (Index("idx_mitre_fields_collection_field", "collection", "field"),)
 
 class Relation(Base):
@@ -282,10 +320,11 @@ class Revision(Base):
     __tablename__ = "mitre_revisions"
     collection: Mapped[str] = mapped_column(ForeignKey("mitre_collections.collection"), nullable=False, index=True)
     item_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False, index=True)
-    data: Mapped[JSON] = mapped_column(JSON, nullable=False)
+    data: Mapped[JSONB] = mapped_column(JSONB, nullable=False)
     status: Mapped[str] = mapped_column(String, nullable=False, default="draft", index=True)
     created_by: Mapped[uuid.UUID] = mapped_column(ForeignKey("mitre_users.id"), nullable=False)
-    created_at: Mapped[datetime.datetime] = mapped_column(DateTime, nullable=False, default=datetime.datetime.now)
+    created_at: Mapped[created_ts]
+    author: Mapped["User"] = relationship("User", lazy="raise")
 
 class Navigation(Base):
     __tablename__ = "mitre_navigation"
@@ -312,23 +351,41 @@ class Translation(Base):
 class Content(Base):
     __tablename__ = "mitre_content"
     collection: Mapped[str] = mapped_column(ForeignKey("mitre_collections.collection"), nullable=False, index=True)
-    data: Mapped[JSON] = mapped_column(JSON, nullable=False)
+    data: Mapped[JSONB] = mapped_column(JSONB, nullable=False)
     status: Mapped[str] = mapped_column(String, nullable=False, default="draft", index=True)
     created_by: Mapped[uuid.UUID] = mapped_column(ForeignKey("mitre_users.id"), nullable=False, index=True)
-    created_at: Mapped[datetime.datetime] = mapped_column(DateTime, nullable=False, default=datetime.datetime.now)
+    created_at: Mapped[created_ts]
     updated_at: Mapped[Optional[datetime.datetime]] = mapped_column(DateTime, nullable=True)
     published_at: Mapped[Optional[datetime.datetime]] = mapped_column(DateTime, nullable=True)
     is_draft: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True, index=True)
     last_modified: Mapped[datetime.datetime] = mapped_column(
-        DateTime, nullable=False, default=datetime.datetime.utcnow, onupdate=datetime.datetime.utcnow,
+        DateTime, nullable=False, server_default=func.now(), onupdate=func.now(),
         comment="Timestamp of last content change"
     )
     version: Mapped[int] = mapped_column(
         Integer, nullable=False, default=1,
         comment="Incrementing version for optimistic locking"
     )
+    author: Mapped["User"] = relationship("User", lazy="raise")
     __table_args__ = (
-        Index("idx_mitre_content_collection_status", "collection", "status"),
-        Index("idx_mitre_content_created_by", "created_by"),
+        # (collection, status) lookups are covered by this wider index
         Index("idx_content_collection_status_lastmod", "collection", "status", "last_modified"),
+        # Partial index for the published-content feed
+        Index(
+            "idx_content_published", "collection", "published_at",
+            postgresql_where=text("status = 'published' AND is_draft = false"),
+        ),
+        # GIN index so data->>'...' / @> filters become index scans
+        Index("idx_content_data_gin", "data", postgresql_using="gin"),
     )
+
+
+# All models are declared above; compile their CREATE TABLE DDL for the
+# postgresql dialect once at import so workers and tooling reuse the
+# cached strings instead of paying lazy per-dialect compilation on first
+# use. Alembic remains the owner of schema changes; this is for
+# bootstrap/debug tooling only.
+DDL_STATEMENTS: tuple = tuple(
+    str(CreateTable(table).compile(dialect=postgresql.dialect()))
+    for table in Base.metadata.sorted_tables
+)
@@ -6,20 +6,38 @@ from sqlalchemy.ext.asyncio import (
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.pool import NullPool
 
 from setting import setting
 
 db_session_var: ContextVar[AsyncSession | None] = ContextVar("db_session", default=None)
 
+if setting.PGBOUNCER:
+    # PgBouncer (pool_mode=transaction) owns the pool: hand every
+    # connection straight back and disable asyncpg's server-side prepared
+    # statement cache, since statements don't survive transaction
+    # multiplexing
+    _engine_kwargs = dict(
+        poolclass=NullPool,
+        connect_args={"statement_cache_size": 0},
+    )
+else:
+    _engine_kwargs = dict(
+        pool_size=20,  # Max number of connections in the pool
+        max_overflow=10,  # Allow 10 extra connections beyond the pool_size
+        pool_timeout=30,  # Wait time (seconds) for a connection from the pool before raising an error
+        pool_recycle=1800,  # Recycle connections every 30 minutes (prevents stale connections)
+        pool_pre_ping=True,  # Probe connections on checkout instead of failing mid-request
+    )
 
 # Create an async async_engine
 async_engine = create_async_engine(
     setting.DB_URI,
     echo=False,  # Disable SQLAlchemy echoing queries (useful in production)
-    pool_size=20,  # Max number of connections in the pool
-    max_overflow=10,  # Allow 10 extra connections beyond the pool_size
-    pool_timeout=30,  # Wait time (seconds) for a connection from the pool before raising an error
-    pool_recycle=1800,  # Recycle connections every 30 minutes (prevents stale connections)
+    # Compiled-statement LRU: sized above the default 500 so every hot
+    # select()/insert() shape stays cached and skips recompilation
+    query_cache_size=1200,
+    **_engine_kwargs,
 )
 async_session = async_sessionmaker(
     bind=async_engine,
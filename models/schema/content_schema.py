@@ -0,0 +1,58 @@
+import uuid
+from typing import Any, Dict, Optional
+
+from marshmallow import Schema, fields
+from pydantic import BaseModel, Field
+
+from models.orm_models.core import Content
+
+__all__ = ["CreateContent", "ContentSchema"]
+
+
+class ContentSchema(Schema):
+    """Output schema for a content item.
+    """
+
+    id = fields.UUID()
+    collection = fields.Str()
+    data = fields.Dict()
+    status = fields.Str()
+    created_by = fields.UUID()
+    created_at = fields.DateTime()
+    updated_at = fields.DateTime()
+    published_at = fields.DateTime()
+    is_draft = fields.Bool()
+    version = fields.Int()
+
+    class Meta:
+        model = Content
+
+
+class CreateContent(BaseModel):
+    """
+    Pydantic model for the mitre_content table, representing a content item.
+    """
+    collection: str = Field(
+        ...,
+        description="Collection this content item belongs to",
+        min_length=1,
+    )
+    data: Dict[str, Any] = Field(
+        ...,
+        description="Content payload",
+    )
+    status: str = Field(
+        default="draft",
+        description="Workflow status of the item",
+    )
+    created_by: uuid.UUID = Field(
+        ...,
+        description="User creating the item",
+    )
+    is_draft: Optional[bool] = Field(
+        default=True,
+        description="Whether the item is still a draft",
+    )
+
+    class Config:
+        extra = "forbid"
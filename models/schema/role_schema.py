@@ -0,0 +1,49 @@
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+__all__ = ["CreateRole", "UpdateRole"]
+
+
+class CreateRole(BaseModel):
+    """
+    Pydantic model for creating a role.
+    """
+    name: str = Field(
+        ...,
+        description="Unique role name",
+        min_length=1,
+    )
+    description: Optional[str] = Field(
+        default=None,
+        description="Human-readable description of the role",
+    )
+    permissions: List[str] = Field(
+        default_factory=list,
+        description="Permission identifiers granted to the role",
+    )
+
+    class Config:
+        extra = "forbid"
+
+
+class UpdateRole(BaseModel):
+    """
+    Pydantic model for partially updating a role.
+    """
+    name: Optional[str] = Field(
+        default=None,
+        description="Unique role name",
+        min_length=1,
+    )
+    description: Optional[str] = Field(
+        default=None,
+        description="Human-readable description of the role",
+    )
+    permissions: Optional[List[str]] = Field(
+        default=None,
+        description="Permission identifiers granted to the role",
+    )
+
+    class Config:
+        extra = "forbid"
@@ -1,18 +1,27 @@
 from fastapi.routing import APIRouter
-from .field_router import field_router
-from .content_router import content_router
+
+from .collection_router import collections_router
+from .content_router import contents_router
+from .device_router import devices_router
+from .field_router import fields_router
 from .menu_router import menu_router
 from .permission_router import permission_router
 from .role_router import role_router
 from .taxonomy_router import taxonomy_router
 from .user_router import user_router
-from .collection_router import collections_router
 
 routes = APIRouter(prefix="/api")
-routes.include_router(user_router)
-routes.include_router(collections_router)
-routes.include_router(content_router)
-routes.include_router(permission_router)
-routes.include_router(role_router)
-routes.include_router(taxonomy_router)
-routes.include_router(menu_router)
+# include_router copies each child's routes into this router's flat
+# table at import time, so request dispatch matches against one list
+for _router in (
+    user_router,
+    collections_router,
+    contents_router,
+    devices_router,
+    fields_router,
+    permission_router,
+    role_router,
+    taxonomy_router,
+    menu_router,
+):
+    routes.include_router(_router)
@@ -9,7 +9,7 @@ from models.schema.collection_schema import (
     CreateCollection,
     CollectionSchema,
 )
-from core import get_response_schema, CustomResponse
+from core import get_response_schema, CustomResponse, cached_fetch, invalidate
 
 # APIRouter with versioning and auth dependency
 collections_router = APIRouter(
@@ -39,6 +39,7 @@ async def create_collection(
         session=session,
         data=data.model_dump(),
     )
+    await invalidate("mitre_collections")
     schema = CollectionSchema()
     return CustomResponse(content=schema.dump(collection), status_code=201)
 
@@ -58,9 +59,14 @@ async def list_collections(
         offset = (page - 1) * limit
         query = query.offset(offset)
 
-    fields = (await session.execute(query)).scalars().all()
-    schema = CollectionSchema()
-    content = schema.dump(fields, many=True)
+    # Collections are config-shaped: read constantly, written rarely
+    content = await cached_fetch(
+        session,
+        query,
+        CollectionSchema(),
+        ttl=60,
+        tags=("mitre_collections",),
+    )
     return CustomResponse(content=content, status_code=200)
 
 
@@ -100,6 +106,7 @@ async def update_collection(
         raise_exception=True
     )
     collection = await collection.update(session, data)
+    await invalidate("mitre_collections")
     schema = CollectionSchema()
     return CustomResponse(content=schema.dump(collection), status_code=200)
 
@@ -126,6 +133,7 @@ async def delete_collection(
         raise_exception=True
     )
     await collection.delete(session)
+    await invalidate("mitre_collections")
     return CustomResponse(message="")
 
 
@@ -3,6 +3,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, Request, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from core.dataloader import Users
 from core.dependencies import DBSession
 from models.orm_models.core import Content
 from models.schema.content_schema import CreateContent, ContentSchema
@@ -21,6 +22,21 @@ contents_router = APIRouter(
     },
 )
 
+# Columns returned by list views. Selecting columns instead of the
+# entity skips ORM hydration (instance dict, InstanceState, identity
+# map) per row and leaves the heavy `data` blob out of list payloads.
+_LIST_COLUMNS = (
+    Content.id,
+    Content.collection,
+    Content.status,
+    Content.created_by,
+    Content.created_at,
+    Content.updated_at,
+    Content.published_at,
+    Content.is_draft,
+    Content.version,
+)
+
 
 @contents_router.post(
     "/",
@@ -43,12 +59,13 @@ async def create_content(
 @contents_router.get("/")
 async def list_contents(
     request: Request,
+    users: Users,
     session: AsyncSession = Depends(DBSession),
     page: int = 1,
     limit: int = 100,
 ):
     """List all content items with pagination"""
-    query = select(Content)
+    query = select(*_LIST_COLUMNS)
     if limit:
         query = query.limit(limit)
 
@@ -56,9 +73,13 @@ async def list_contents(
         offset = (page - 1) * limit
         query = query.offset(offset)
 
-    contents = (await session.execute(query)).scalars().all()
-    schema = ContentSchema()
-    content = schema.dump(contents, many=True)
+    rows = (await session.execute(query)).mappings().all()
+    # One batched WHERE id IN (...) query for all authors on the page
+    authors = await users.load_many([row["created_by"] for row in rows])
+    content = [
+        {**row, "author_email": author.email if author else None}
+        for row, author in zip(rows, authors)
+    ]
     return CustomResponse(content=content, status_code=200)
 
 
@@ -153,12 +174,13 @@ async def publish_content(
 )
 async def list_drafts(
     request: Request,
+    users: Users,
     session: AsyncSession = Depends(DBSession),
     page: int = 1,
     limit: int = 100,
 ):
     """List all draft content items"""
-    query = select(Content).filter_by(is_draft=True)
+    query = select(*_LIST_COLUMNS).where(Content.is_draft.is_(True))
     if limit:
         query = query.limit(limit)
 
@@ -166,9 +188,12 @@ async def list_drafts(
         offset = (page - 1) * limit
         query = query.offset(offset)
 
-    drafts = (await session.execute(query)).scalars().all()
-    schema = ContentSchema()
-    content = schema.dump(drafts, many=True)
+    rows = (await session.execute(query)).mappings().all()
+    authors = await users.load_many([row["created_by"] for row in rows])
+    content = [
+        {**row, "author_email": author.email if author else None}
+        for row, author in zip(rows, authors)
+    ]
     return CustomResponse(content=content, status_code=200)
 
 
@@ -190,19 +215,3 @@ async def save_revision(
     revision = await content.save_revision(session)
     schema = ContentSchema()
     return CustomResponse(content=schema.dump(revision), status_code=201)
-
-
-@content_router.patch("/{content_id}/publish", status_code=status.HTTP_200_OK)
-async def publish_content(content_id: int, request: Request):
-    pass
-
-
-@content_router.get("/drafts/", status_code=status.HTTP_200_OK)
-async def get_drafts(request: Request):
-    pass
-
-
-@content_router.post("/{content_id}/revisions/",
-                     status_code=status.HTTP_201_CREATED)
-async def save_revision(content_id: int, request: Request):
-    pass
@@ -0,0 +1,53 @@
+from uuid import UUID
+
+import orjson
+from fastapi import APIRouter, Request, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+
+from models.orm_models.core import DeviceEvent
+from models.orm_models.db import async_session
+
+devices_router = APIRouter(prefix="/devices", tags=["Devices"])
+
+
+@devices_router.get(
+    "/{device_id}/events/export",
+    status_code=status.HTTP_200_OK,
+)
+async def export_events(
+        request: Request,
+        device_id: UUID,
+):
+    """Stream all events for a device as NDJSON"""
+
+    query = (
+        select(
+            DeviceEvent.id,
+            DeviceEvent.event_type,
+            DeviceEvent.payload,
+            DeviceEvent.timestamp,
+            DeviceEvent.processed,
+        )
+        .where(DeviceEvent.device_id == device_id)
+        .order_by(DeviceEvent.timestamp)
+        # Server-side cursor: rows arrive in batches of 1000 instead of
+        # materializing the whole result set in worker memory
+        .execution_options(yield_per=1000)
+    )
+
+    async def stream():
+        # The generator owns its session: the request-scoped dependency
+        # is torn down before the response body is iterated, so using it
+        # here would run the query on a connection nothing returns to
+        # the pool. This context manager closes it when the stream ends
+        # or the client disconnects.
+        async with async_session() as session:
+            result = await session.stream(query)
+            async for partition in result.mappings().partitions(1000):
+                yield b"".join(
+                    orjson.dumps(dict(row), default=str) + b"\n"
+                    for row in partition
+                )
+
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
@@ -6,7 +6,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from core.dependencies import DBSession
 from models.orm_models.core import Field
 from models.schema.field_schema import CreateField, FieldSchema
-from core import get_response_schema, CustomResponse
+from core import get_response_schema, CustomResponse, cached_fetch, invalidate
 
 # APIRouter with versioning and auth dependency
 fields_router = APIRouter(
@@ -36,6 +36,7 @@ async def create_field(
         session=session,
         data=data.model_dump(),
     )
+    await invalidate("mitre_fields")
     schema = FieldSchema()
     return CustomResponse(content=schema.dump(field), status_code=201)
 
@@ -56,9 +57,14 @@ async def list_fields(
         offset = (page - 1) * limit
         query = query.offset(offset)
 
-    fields = (await session.execute(query)).scalars().all()
-    schema = FieldSchema()
-    content = schema.dump(fields, many=True)
+    # Fields are config-shaped: read constantly, written rarely
+    content = await cached_fetch(
+        session,
+        query,
+        FieldSchema(),
+        ttl=60,
+        tags=("mitre_fields",),
+    )
     return CustomResponse(content=content, status_code=200)
 
 
@@ -98,6 +104,7 @@ async def update_field(
         raise_exception=True,
     )
     field = await field.update(session, data.model_dump())
+    await invalidate("mitre_fields")
     schema = FieldSchema()
     return CustomResponse(content=schema.dump(field), status_code=200)
 
@@ -124,4 +131,5 @@ async def delete_field(
         raise_exception=True,
     )
     await field.delete(session)
+    await invalidate("mitre_fields")
     return CustomResponse(message="")
\ No newline at end of file
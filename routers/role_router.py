@@ -1,28 +1,83 @@
-from fastapi import APIRouter, Request, status
+import hashlib
+from uuid import UUID
+
+import orjson
+from async_lru import alru_cache
+from fastapi import APIRouter, Request, Response, status
+
+from core import CustomResponse
+from models.schema.role_schema import CreateRole, UpdateRole
 
 role_router = APIRouter(prefix="/roles", tags=["Roles"])
 
 
+def _etag(content) -> str:
+    """Weak content hash used for If-None-Match short-circuits."""
+    digest = hashlib.blake2b(
+        orjson.dumps(content, default=str), digest_size=16,
+    )
+    return digest.hexdigest()
+
+
+@alru_cache(maxsize=1024, ttl=30)
+async def _load_roles():
+    """Fetch the role list; served from the LRU within the TTL."""
+    # TODO: query the Role model once it exists
+    return []
+
+
+@alru_cache(maxsize=1024, ttl=30)
+async def _load_role(role_id: UUID):
+    """Fetch a single role; cached per id within the TTL."""
+    # TODO: query the Role model once it exists
+    return None
+
+
+def _invalidate_roles() -> None:
+    """Drop cached role reads after any write."""
+    _load_roles.cache_clear()
+    _load_role.cache_clear()
+
+
 @role_router.get("/", status_code=status.HTTP_200_OK)
 async def list_roles(request: Request):
     """List all roles"""
+    content = await _load_roles()
+    etag = _etag(content)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304)
+    return CustomResponse(
+        content=content,
+        headers={"etag": etag, "cache-control": "public, max-age=30"},
+    )
 
 
 @role_router.post("/", status_code=status.HTTP_201_CREATED)
-async def create_role(request: Request):
+async def create_role(data: CreateRole):
     """Create a new role"""
+    _invalidate_roles()
 
 
 @role_router.get("/{role_id}", status_code=status.HTTP_200_OK)
-async def retrieve_role(request: Request, role_id: str):
+async def retrieve_role(request: Request, role_id: UUID):
     """Retrieve a role by ID"""
+    content = await _load_role(role_id)
+    etag = _etag(content)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304)
+    return CustomResponse(
+        content=content,
+        headers={"etag": etag, "cache-control": "public, max-age=30"},
+    )
 
 
 @role_router.patch("/{role_id}", status_code=status.HTTP_200_OK)
-async def update_role(request: Request, role_id: str):
+async def update_role(role_id: UUID, data: UpdateRole):
     """Update a role by ID"""
+    _invalidate_roles()
 
 
 @role_router.delete("/{role_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_role(request: Request, role_id: str):
+async def delete_role(role_id: UUID):
     """Delete a role by ID"""
+    _invalidate_roles()
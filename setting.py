@@ -4,6 +4,16 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 class Setting(BaseSettings):
     model_config = SettingsConfigDict(env_file=".env", extra="allow")
     DB_URI: str
+    # "dev" enables auto-reload and verbose logging; anything else is
+    # treated as production (multi-worker, quiet logs)
+    ENV: str = "dev"
+    # True when DB_URI points at PgBouncer in transaction-pooling mode;
+    # pooling then belongs to PgBouncer, not to each worker process
+    PGBOUNCER: bool = False
+    # Redis instance backing the read-query cache
+    REDIS_URI: str = "redis://localhost:6379/0"
+    # Keys the refresh-token digests; override outside dev
+    SECRET_KEY: str = "dev-secret"
 
 
 setting = Setting()